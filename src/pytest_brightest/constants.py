@@ -15,6 +15,7 @@ NODEID = "nodeid"
 SETUP = "setup"
 TEARDOWN = "teardown"
 TESTS = "tests"
+TEST_STAGES = (SETUP, CALL, TEARDOWN)
 
 # define pytest-specific constants
 FSPATH = "fspath"
@@ -23,14 +24,11 @@ NODEID = "nodeid"
 NODEID_SEPARATOR = "::"
 
 # define constants for test outcomes
-TOTAL_DURATION = "total_duration"
 OUTCOME = "outcome"
 UNKNOWN = "unknown"
-SETUP_DURATION = "setup_duration"
-CALL_DURATION = "call_duration"
-TEARDOWN_DURATION = "teardown_duration"
 FAILED = "failed"
 ERROR = "error"
+FAILING_OUTCOMES = frozenset((FAILED, ERROR))
 
 # define constants for json report
 JSON_REPORT_FILE = "json_report_file"
@@ -57,6 +55,7 @@ PYTEST_BRIGHTEST_OUT_JSON = "pytest-brightest-output.json"
 SHUFFLE = "shuffle"
 NAME = "name"
 COST = "cost"
+REORDERING_TECHNIQUES = frozenset((NAME, COST, FAILURE))
 
 # define constants for reordering focus
 MODULES_WITHIN_SUITE = "modules-within-suite"
@@ -37,8 +37,7 @@ from .constants import (
     MODULES_WITHIN_SUITE,
     NAME,
     NEWLINE,
-    NODEID,
-    NODEID_SEPARATOR,
+    REORDERING_TECHNIQUES,
     SEED,
     SHUFFLE,
     TECHNIQUE,
@@ -48,7 +47,12 @@ from .constants import (
     TESTS_WITHIN_MODULE,
     TIMESTAMP,
 )
-from .reorder import ReordererOfTests, setup_json_report_plugin
+from .reorder import (
+    ReordererOfTests,
+    _group_items_by_module,
+    _module_of,
+    setup_json_report_plugin,
+)
 from .shuffler import ShufflerOfTests, generate_random_seed
 
 # create a default console
@@ -122,7 +126,7 @@ class BrightestPlugin:
                     f"{HIGH_BRIGHTNESS_PREFIX} Warning: --reorder-in-direction is ignored when --reorder-by-technique is 'shuffle'"
                 )
         # if the reordering technique is chosen, then configure the reorderer
-        elif self.technique in [NAME, COST, FAILURE]:
+        elif self.technique in REORDERING_TECHNIQUES:
             self.reorder_enabled = True
             self.reorder_by = self.technique
             self.reorder = self.direction
@@ -135,7 +139,7 @@ class BrightestPlugin:
     def record_test_failure(self, nodeid: str) -> None:
         """Record a test failure for the current session."""
         if nodeid:
-            module_path = nodeid.split(NODEID_SEPARATOR)[0]
+            module_path = _module_of(nodeid)
             if module_path not in self.current_session_failures:
                 self.current_session_failures[module_path] = 0
             self.current_session_failures[module_path] += 1
@@ -252,7 +256,7 @@ def pytest_runtest_logreport(report: TestReport) -> None:
         _plugin.record_test_failure(report.nodeid)
 
 
-def _get_brightest_data(session: Session) -> Dict[str, Any]:  # noqa: PLR0912, PLR0915
+def _get_brightest_data(session: Session) -> Dict[str, Any]:
     """Collect brightest data for the JSON report."""
     brightest_data: Dict[str, Any] = {
         TIMESTAMP: datetime.now().isoformat(),
@@ -277,17 +281,14 @@ def _get_brightest_data(session: Session) -> Dict[str, Any]:  # noqa: PLR0912, P
         # reload the test data to get the current session's performance data
         # that was just written by pytest-json-report
         _plugin.reorderer.load_test_data()
-        current_module_costs: Dict[str, float] = {}
-        current_test_costs: Dict[str, float] = {}
-        for item in session.items:
-            nodeid = getattr(item, NODEID, "")
-            if nodeid:
-                cost = _plugin.reorderer.get_test_total_duration(item)
-                module_path = nodeid.split("::")[0]
-                current_module_costs[module_path] = (
-                    current_module_costs.get(module_path, 0.0) + cost
-                )
-                current_test_costs[nodeid] = cost
+        current_module_costs = _plugin.reorderer.get_module_costs(
+            _group_items_by_module(session.items)
+        )
+        current_test_costs = {
+            item.nodeid: _plugin.reorderer.get_test_total_duration(item)
+            for item in session.items
+            if item.nodeid
+        }
         if _plugin.focus == MODULES_WITHIN_SUITE:
             brightest_data[CURRENT_MODULE_COSTS] = current_module_costs
         elif _plugin.focus == TESTS_WITHIN_MODULE:
@@ -300,32 +301,22 @@ def _get_brightest_data(session: Session) -> Dict[str, Any]:  # noqa: PLR0912, P
         brightest_data[TEST_COSTS] = current_test_costs
     elif _plugin.technique == NAME:
         if _plugin.focus == MODULES_WITHIN_SUITE:
-            current_module_order = []
-            for item in session.items:
-                nodeid = getattr(item, NODEID, "")
-                if nodeid:
-                    module_path = nodeid.split("::")[0]
-                    if module_path not in current_module_order:
-                        current_module_order.append(module_path)
+            current_module_order = list(_group_items_by_module(session.items))
             brightest_data[CURRENT_MODULE_ORDER] = current_module_order
             # maintain legacy key for backward compatibility
             brightest_data[MODULE_ORDER] = current_module_order
         elif _plugin.focus == TESTS_ACROSS_MODULES:
-            current_test_order = [
-                getattr(item, NODEID, "") for item in session.items
-            ]
+            current_test_order = [item.nodeid for item in session.items]
             brightest_data[CURRENT_TEST_ORDER] = current_test_order
             # maintain legacy key for backward compatibility
             brightest_data[TEST_ORDER] = current_test_order
         elif _plugin.focus == TESTS_WITHIN_MODULE:
-            current_module_tests: Dict[str, List[str]] = {}
-            for item in session.items:
-                nodeid = getattr(item, NODEID, "")
-                if nodeid:
-                    module_path = nodeid.split("::")[0]
-                    if module_path not in current_module_tests:
-                        current_module_tests[module_path] = []
-                    current_module_tests[module_path].append(nodeid)
+            current_module_tests = {
+                module_path: [item.nodeid for item in module_group]
+                for module_path, module_group in _group_items_by_module(
+                    session.items
+                ).items()
+            }
             brightest_data[CURRENT_MODULE_TESTS] = current_module_tests
             # maintain legacy key for backward compatibility
             brightest_data[MODULE_TESTS] = current_module_tests
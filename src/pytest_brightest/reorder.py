@@ -1,29 +1,36 @@
 """Test reordering functionality based on previous test behavior."""
 
 import json
+import sys
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
 from rich.console import Console
 
 from .constants import (
     ASCENDING,
     BRIGHTEST,
-    CALL,
-    CALL_DURATION,
     COST,
-    DEFAULT_FILE_ENCODING,
     DEFAULT_PYTEST_JSON_REPORT_PATH,
     DURATION,
     EMPTY_STRING,
-    ERROR,
-    FAILED,
+    FAILING_OUTCOMES,
     FAILURE,
     FLASHLIGHT_PREFIX,
     HIGH_BRIGHTNESS_PREFIX,
     JSON_REPORT_FILE,
     MODULES_WITHIN_SUITE,
     NAME,
+    NEWLINE,
     NODEID,
     NODEID_SEPARATOR,
     OUTCOME,
@@ -36,14 +43,10 @@ from .constants import (
     PYTEST_CACHE_DIR,
     PYTEST_JSON_REPORT_PLUGIN_NAME,
     REPORT_JSON,
-    SETUP,
-    SETUP_DURATION,
-    TEARDOWN,
-    TEARDOWN_DURATION,
+    TEST_STAGES,
     TESTS,
     TESTS_ACROSS_MODULES,
     TESTS_WITHIN_MODULE,
-    TOTAL_DURATION,
     UNKNOWN,
     ZERO_COST,
 )
@@ -56,6 +59,53 @@ if TYPE_CHECKING:
 console = Console()
 
 
+def _module_of(nodeid: str) -> str:
+    """Get the module path from the node ID of a test case."""
+    # the module path is the part of the nodeid before the first "::"
+    return nodeid.partition(NODEID_SEPARATOR)[0]
+
+
+def _group_items_by_module(items: List["Item"]) -> Dict[str, List["Item"]]:
+    """Group test items by their module while preserving the module order."""
+    module_items: Dict[str, List["Item"]] = {}
+    # group the items by module; the keys record the order of the modules
+    for item in items:
+        nodeid = item.nodeid
+        if nodeid:
+            module_path = _module_of(nodeid)
+            module_group = module_items.get(module_path)
+            if module_group is None:
+                module_group = module_items[module_path] = []
+            module_group.append(item)
+    return module_items
+
+
+def _print_diagnostics(lines: List[str]) -> None:
+    """Display a group of diagnostic messages with a single console call."""
+    # add an extra newline to separate the messages from the prior output
+    if lines:
+        console.print(NEWLINE + NEWLINE.join(lines))
+
+
+def _replace_with_module_order(
+    items: List["Item"],
+    module_items: Dict[str, List["Item"]],
+    sorted_modules: List[str],
+    describe_module: Callable[[str], str],
+) -> None:
+    """Replace the items with the items of each module in the sorted order."""
+    reordered_items: List["Item"] = []
+    diagnostic_lines = []
+    # iterate over the sorted modules and add their items to the reordered list
+    for module in sorted_modules:
+        diagnostic_lines.append(describe_module(module))
+        reordered_items.extend(module_items[module])
+    # display all of the diagnostic messages for the modules at once
+    _print_diagnostics(diagnostic_lines)
+    # replace the original list of items with the reordered list
+    items[:] = reordered_items
+
+
 class ReordererOfTests:
     """Handle test reordering based on previous test performance data."""
 
@@ -66,110 +116,111 @@ class ReordererOfTests:
         self.json_report_path = (
             json_report_path or DEFAULT_PYTEST_JSON_REPORT_PATH
         )
-        # the test_data dictionary stores details about the test cases
-        # that enables them to be reordered; for instance, it stores
-        # information about the cumulative execution time of a test
-        self.test_data: Dict[str, Dict[str, Any]] = {}
+        # the path to the JSON report file
+        self._report_path = Path(self.json_report_path)
+        # the details about the test cases that enable them to be reordered,
+        # stored as flat dictionaries that map a node ID to one value
+        self._total_durations: Dict[str, float] = {}
+        self._outcomes: Dict[str, str] = {}
         self.last_module_failure_counts: Optional[Dict[str, int]] = None
-        self.brightest_data: Optional[Dict[str, Any]] = None
-        # extract the data from the pytest-json-report that was found
-        # and store it in the dictionary called test_data
-        self.load_test_data()
+        # the brightest data that was stored in the report by a prior run
+        self._brightest_data: Dict[str, Any] = {}
+        # the report is only read the first time that its data is needed
+        self._loaded = False
+
+    @property
+    def brightest_data(self) -> Dict[str, Any]:
+        """Get the brightest data from the report, loading it on first use."""
+        self._ensure_loaded()
+        return self._brightest_data
+
+    def _ensure_loaded(self) -> None:
+        """Load the test execution data if it was not already loaded."""
+        if not self._loaded:
+            self.load_test_data()
 
     def load_test_data(self) -> None:
         """Load test execution data from the pytest-json-report report file."""
-        # create a pathlib Path object for the JSON report file; remember
-        # that pytest-brightest does not have its own mechanism for collecting
-        # data about test execution as it instead relies on the pytest-json-report
-        # plugin to generate a JSON report file that contains the test data
-        report_path = Path(self.json_report_path)
-        # if the report does not exist in the default location then
-        # the data from it cannot be extracted and thus the loading
-        # function can return early without doing anything
-        if not report_path.exists():
-            return
-        # attempt to read the JSON file and parse it to extract the data
+        # only inspect a missing or malformed report once during a session
+        self._loaded = True
+        # attempt to read the JSON file and parse it to extract the data;
+        # note that a report that does not exist raises an OSError
         try:
-            with report_path.open("r", encoding=DEFAULT_FILE_ENCODING) as file:
-                # load the JSON data from the file
-                data = json.load(file)
-                # store the brightest data if it exists for historical information
-                self.brightest_data = data.get(BRIGHTEST, {})
-                # there is data about test cases
-                # that were executed in the list of test information
-                if TESTS in data:
-                    # iterate through each test in the JSON data that
-                    # is its own dictionary in a list of the test dictionaries
-                    for test in data[TESTS]:
-                        # extract the node ID for the test case
-                        node_id = test.get(NODEID, EMPTY_STRING)
-                        # if the node ID is not empty then it is okay to extract
-                        # the setup, call, and teardown durations for the test case
-                        if node_id:
-                            setup_duration = test.get(SETUP, {}).get(
-                                DURATION, 0.0
-                            )
-                            call_duration = test.get(CALL, {}).get(
-                                DURATION, 0.0
-                            )
-                            teardown_duration = test.get(TEARDOWN, {}).get(
-                                DURATION, 0.0
-                            )
-                            # calculate the total duration (i.e., the cumulative
-                            # execution time for the test case) that will include
-                            # the reported costs for these three test stages:
-                            # --> setup, call, and teardown
-                            total_duration = (
-                                setup_duration
-                                + call_duration
-                                + teardown_duration
-                            )
-                            # store the test data in the dictionary
-                            self.test_data[node_id] = {
-                                TOTAL_DURATION: total_duration,
-                                OUTCOME: test.get(OUTCOME, UNKNOWN),
-                                SETUP_DURATION: setup_duration,
-                                CALL_DURATION: call_duration,
-                                TEARDOWN_DURATION: teardown_duration,
-                            }
+            data = json.loads(self._report_path.read_bytes())
+            # only store the data once every test was read without an error
+            total_durations: Dict[str, float] = {}
+            outcomes: Dict[str, str] = {}
+            intern = sys.intern
+            # iterate through each test in the JSON data
+            for test in data.get(TESTS, ()):
+                # extract the node ID for the test case
+                node_id = test.get(NODEID, EMPTY_STRING)
+                if not node_id:
+                    continue
+                # calculate the total duration (i.e., the cumulative
+                # execution time for the test case) that will include
+                # the reported costs for these three test stages:
+                # --> setup, call, and teardown
+                total_duration = ZERO_COST
+                for stage in TEST_STAGES:
+                    stage_data = test.get(stage)
+                    if stage_data:
+                        total_duration += stage_data.get(DURATION, ZERO_COST)
+                # intern the outcome so that the tests share its string
+                outcome = test.get(OUTCOME, UNKNOWN)
+                outcome = (
+                    intern(outcome) if isinstance(outcome, str) else UNKNOWN
+                )
+                total_durations[node_id] = total_duration
+                outcomes[node_id] = outcome
+            self._total_durations = total_durations
+            self._outcomes = outcomes
+            # store the brightest data if it exists for historical information
+            self._brightest_data = data.get(BRIGHTEST) or {}
         # something went wrong while reading the JSON file
-        except (json.JSONDecodeError, KeyError, OSError):
+        except (json.JSONDecodeError, KeyError, OSError, TypeError):
             # if there is an error reading the JSON file, then do not
             # attempt to load any data from it and instead just return
             pass
 
     def get_test_total_duration(self, item: "Item") -> float:
         """Get the total duration of a test item from previous run(s)."""
-        # a pytest item has a nodeid attribute that uniquely identifies it
-        node_id = getattr(item, NODEID, EMPTY_STRING)
-        # retrieve the test information from the test_data dictionary
-        test_info = self.test_data.get(node_id, {})
+        self._ensure_loaded()
+        # a pytest item has a nodeid attribute that uniquely identifies it;
         # return the total duration of the test, or zero if it is not available
-        return test_info.get(TOTAL_DURATION, ZERO_COST)
+        return self._total_durations.get(item.nodeid, ZERO_COST)
+
+    def _get_total_duration_key(self) -> Callable[["Item"], float]:
+        """Get a sort key that finds the total duration of a test item."""
+        # load the data once instead of on every call of the key function
+        self._ensure_loaded()
+        total_durations = self._total_durations
+        return lambda item: total_durations.get(item.nodeid, ZERO_COST)
 
     def get_test_outcome(self, item: "Item") -> str:
         """Get the outcome of a test item from previous run(s)."""
-        # a pytest item has a nodeid attribute that uniquely identifies it
-        node_id = getattr(item, NODEID, EMPTY_STRING)
-        # retrieve the test information from the test_data dictionary
-        test_info = self.test_data.get(node_id, {})
+        self._ensure_loaded()
+        # a pytest item has a nodeid attribute that uniquely identifies it;
         # return the outcome of the test, or unknown if it is not available
-        return test_info.get(OUTCOME, UNKNOWN)
+        return self._outcomes.get(item.nodeid, UNKNOWN)
 
     def classify_tests_by_outcome(
         self, items: List["Item"]
     ) -> Tuple[List["Item"], List["Item"]]:
         """Classify tests into passing and failing based on previous outcomes."""
-        passing_tests = []
-        failing_tests = []
+        passing_tests: List["Item"] = []
+        failing_tests: List["Item"] = []
+        # bind the outcome lookup and the append methods to local names
+        outcome_of = self.get_test_outcome
+        append_passing = passing_tests.append
+        append_failing = failing_tests.append
         # iterate over each item and classify it as passing or failing
         for item in items:
-            outcome = self.get_test_outcome(item)
             # the outcome is a string that can be "passed", "failed", or "error"
-            if outcome in [FAILED, ERROR]:
-                failing_tests.append(item)
+            if outcome_of(item) in FAILING_OUTCOMES:
+                append_failing(item)
             else:
-                passing_tests.append(item)
+                append_passing(item)
         return passing_tests, failing_tests
 
     def sort_tests_by_total_duration(
@@ -178,224 +229,169 @@ class ReordererOfTests:
         """Sort tests by total duration in ascending or descending order."""
         # use the sorted function to sort the items by their total duration
         return sorted(
-            items, key=self.get_test_total_duration, reverse=not ascending
+            items, key=self._get_total_duration_key(), reverse=not ascending
         )
 
-    def get_prior_data_for_reordering(  # noqa: PLR0912
+    def get_module_costs(
+        self, module_items: Dict[str, List["Item"]]
+    ) -> Dict[str, float]:
+        """Calculate the cumulative cost of each module from its test items."""
+        # calculate the cumulative cost of each module
+        get_duration = self._get_total_duration_key()
+        return {
+            module_path: sum(map(get_duration, module_group), ZERO_COST)
+            for module_path, module_group in module_items.items()
+        }
+
+    def get_module_failure_counts(
+        self, module_items: Dict[str, List["Item"]]
+    ) -> Dict[str, int]:
+        """Count the tests in each module that failed in previous run(s)."""
+        outcome_of = self.get_test_outcome
+        return {
+            module_path: sum(
+                1
+                for item in module_group
+                if outcome_of(item) in FAILING_OUTCOMES
+            )
+            for module_path, module_group in module_items.items()
+        }
+
+    def get_prior_data_for_reordering(
         self, items: List["Item"], technique: str, focus: str
     ) -> Dict[str, Any]:
         """Get the prior data that was used for reordering during this session."""
         prior_data: Dict[str, Any] = {}
         if technique == COST:
-            module_costs: Dict[str, float] = {}
-            test_costs: Dict[str, float] = {}
-            for item in items:
-                nodeid = getattr(item, NODEID, EMPTY_STRING)
-                if nodeid:
-                    cost = self.get_test_total_duration(item)
-                    module_path = nodeid.split(NODEID)[0]
-                    module_costs[module_path] = (
-                        module_costs.get(module_path, 0.0) + cost
-                    )
-                    test_costs[nodeid] = cost
-            if focus == MODULES_WITHIN_SUITE:
-                prior_data[PRIOR_MODULE_COSTS] = module_costs
-            elif focus == TESTS_WITHIN_MODULE:
-                prior_data[PRIOR_MODULE_COSTS] = module_costs
-                prior_data[PRIOR_TEST_COSTS] = test_costs
-            elif focus == TESTS_ACROSS_MODULES:
-                prior_data[PRIOR_TEST_COSTS] = test_costs
+            # only calculate the aggregates that are recorded for this focus
+            if focus in (MODULES_WITHIN_SUITE, TESTS_WITHIN_MODULE):
+                prior_data[PRIOR_MODULE_COSTS] = self.get_module_costs(
+                    _group_items_by_module(items)
+                )
+            if focus in (TESTS_WITHIN_MODULE, TESTS_ACROSS_MODULES):
+                get_duration = self._get_total_duration_key()
+                prior_data[PRIOR_TEST_COSTS] = {
+                    item.nodeid: get_duration(item)
+                    for item in items
+                    if item.nodeid
+                }
         elif technique == NAME:
             if focus == MODULES_WITHIN_SUITE:
-                module_order = []
-                for item in items:
-                    nodeid = getattr(item, NODEID, "")
-                    if nodeid:
-                        module_path = nodeid.split("::")[0]
-                        if module_path not in module_order:
-                            module_order.append(module_path)
-                prior_data[PRIOR_MODULE_ORDER] = module_order
+                prior_data[PRIOR_MODULE_ORDER] = list(
+                    _group_items_by_module(items)
+                )
             elif focus == TESTS_ACROSS_MODULES:
-                prior_data[PRIOR_TEST_ORDER] = [
-                    getattr(item, NODEID, "") for item in items
-                ]
+                prior_data[PRIOR_TEST_ORDER] = [item.nodeid for item in items]
             elif focus == TESTS_WITHIN_MODULE:
-                module_tests: Dict[str, List[str]] = {}
-                for item in items:
-                    nodeid = getattr(item, NODEID, NODEID_SEPARATOR)
-                    if nodeid:
-                        module_path = nodeid.split(NODEID_SEPARATOR)[0]
-                        if module_path not in module_tests:
-                            module_tests[module_path] = []
-                        module_tests[module_path].append(nodeid)
-                prior_data[PRIOR_MODULE_TESTS] = module_tests
+                prior_data[PRIOR_MODULE_TESTS] = {
+                    module_path: [item.nodeid for item in module_group]
+                    for module_path, module_group in _group_items_by_module(
+                        items
+                    ).items()
+                }
         elif technique == FAILURE:
-            module_failure_counts: Dict[str, int] = {}
-            for item in items:
-                nodeid = getattr(item, NODEID, EMPTY_STRING)
-                if nodeid:
-                    module_path = nodeid.split(NODEID_SEPARATOR)[0]
-                    if module_path not in module_failure_counts:
-                        module_failure_counts[module_path] = 0
-                    if self.get_test_outcome(item) in [FAILED, ERROR]:
-                        module_failure_counts[module_path] += 1
+            # the failure counts are only recorded for the modules focus
             if focus == MODULES_WITHIN_SUITE:
-                prior_data[PRIOR_MODULE_FAILURE_COUNTS] = module_failure_counts
+                prior_data[PRIOR_MODULE_FAILURE_COUNTS] = (
+                    self.get_module_failure_counts(
+                        _group_items_by_module(items)
+                    )
+                )
         return prior_data
 
     def reorder_modules_by_cost(
         self, items: List["Item"], ascending: bool = True
     ) -> None:
         """Reorder test modules by their cumulative cost."""
-        module_costs: Dict[str, float] = {}
-        module_items: Dict[str, List["Item"]] = {}
-        # iterate over each item and calculate the cumulative cost of each module
-        for item in items:
-            nodeid = getattr(item, NODEID, EMPTY_STRING)
-            if nodeid:
-                # the module path is the part of the nodeid before the "::"
-                module_path = nodeid.split(NODEID_SEPARATOR)[0]
-                cost = self.get_test_total_duration(item)
-                module_costs[module_path] = (
-                    module_costs.get(module_path, ZERO_COST) + cost
-                )
-                if module_path not in module_items:
-                    module_items[module_path] = []
-                module_items[module_path].append(item)
+        # group the items by their module in a single pass
+        module_items = _group_items_by_module(items)
+        # calculate the cumulative cost of each module
+        module_costs = self.get_module_costs(module_items)
         # sort the modules by their cumulative cost
         sorted_modules = sorted(
-            module_costs.keys(),
-            key=lambda m: module_costs[m],
+            module_costs,
+            key=module_costs.__getitem__,
             reverse=not ascending,
         )
-        reordered_items = []
-        # if there are sorted modules, then add an extra newline
-        # to separate the diagnostic output from what appeared before
-        if sorted_modules:
-            console.print()
-        # iterate over the sorted modules and add their items to the reordered list
-        for module in sorted_modules:
-            # print out the cost of the module using no more than 5 fixed
-            # decimal places for the execution time of the test case
-            console.print(
+        # record the cost of each module using no more than 5 fixed
+        # decimal places for the execution time of the test cases
+        _replace_with_module_order(
+            items,
+            module_items,
+            sorted_modules,
+            lambda module: (
                 f"{FLASHLIGHT_PREFIX} Module {module} has cost {module_costs[module]:.5f}"
-            )
-            reordered_items.extend(module_items[module])
-        # replace the original list of items with the reordered list
-        items[:] = reordered_items
+            ),
+        )
 
     def reorder_modules_by_name(
         self, items: List["Item"], ascending: bool = True
     ) -> None:
         """Reorder test modules by their name."""
-        module_items: Dict[str, List["Item"]] = {}
-        # iterate over each item and group them by module
-        for item in items:
-            nodeid = getattr(item, NODEID, EMPTY_STRING)
-            if nodeid:
-                module_path = nodeid.split(NODEID_SEPARATOR)[0]
-                if module_path not in module_items:
-                    module_items[module_path] = []
-                module_items[module_path].append(item)
+        # group the items by their module in a single pass
+        module_items = _group_items_by_module(items)
         # sort the modules by their name
-        sorted_modules = sorted(module_items.keys(), reverse=not ascending)
-        reordered_items = []
-        # if there are sorted modules, then add an extra newline
-        # to separate the diagnostic output from what appeared before
-        if sorted_modules:
-            console.print()
-        # iterate over the sorted modules and add their items to the reordered list
-        for module in sorted_modules:
-            console.print(
+        sorted_modules = sorted(module_items, reverse=not ascending)
+        _replace_with_module_order(
+            items,
+            module_items,
+            sorted_modules,
+            lambda module: (
                 f"{FLASHLIGHT_PREFIX} Module {module} is in the reordered suite"
-            )
-            reordered_items.extend(module_items[module])
-        # replace the original list of items with the reordered list
-        items[:] = reordered_items
+            ),
+        )
 
     def reorder_modules_by_failure(
         self, items: List["Item"], ascending: bool = True
     ) -> None:
         """Reorder test modules by their number of failing tests from previous runs."""
-        module_failure_counts: Dict[str, int] = {}
-        module_items: Dict[str, List["Item"]] = {}
-        # iterate over each item and group them by module
-        for item in items:
-            nodeid = getattr(item, NODEID, EMPTY_STRING)
-            if nodeid:
-                module_path = nodeid.split(NODEID_SEPARATOR)[0]
-                if module_path not in module_failure_counts:
-                    module_failure_counts[module_path] = 0
-                    module_items[module_path] = []
-                # get the test outcome from previous run data
-                if self.get_test_outcome(item) in [FAILED, ERROR]:
-                    module_failure_counts[module_path] += 1
-                module_items[module_path].append(item)
+        # group the items by their module in a single pass
+        module_items = _group_items_by_module(items)
+        # count the failing tests in each module using the test
+        # outcomes from the previous run data
+        module_failure_counts = self.get_module_failure_counts(module_items)
         # store the failure counts for potential use in reporting
         self.last_module_failure_counts = module_failure_counts
         # sort the modules by their failure count
         sorted_modules = sorted(
-            module_failure_counts.keys(),
-            key=lambda m: module_failure_counts[m],
+            module_failure_counts,
+            key=module_failure_counts.__getitem__,
             reverse=not ascending,
         )
-        reordered_items = []
-        # if there are sorted modules, then add an extra newline
-        # to separate the diagnostic output from what appeared before
-        if sorted_modules:
-            console.print()
-        # iterate over the sorted modules and add their items to the reordered list
-        for module in sorted_modules:
-            console.print(
+        _replace_with_module_order(
+            items,
+            module_items,
+            sorted_modules,
+            lambda module: (
                 f"{FLASHLIGHT_PREFIX} Module {module} has {module_failure_counts[module]} failing tests from previous run"
-            )
-            reordered_items.extend(module_items[module])
-        # replace the original list of items with the reordered list
-        items[:] = reordered_items
+            ),
+        )
 
     def reorder_tests_within_module(
         self, items: List["Item"], reorder_by: str, ascending: bool = True
     ) -> None:
         """Reorder tests within each module by the specified technique."""
-        module_items: Dict[str, List["Item"]] = {}
-        module_order: List[str] = []
-        # iterate over each item and group them by module
-        for item in items:
-            nodeid = getattr(item, NODEID, EMPTY_STRING)
-            if nodeid:
-                module_path = nodeid.split(NODEID_SEPARATOR)[0]
-                if module_path not in module_items:
-                    module_items[module_path] = []
-                    module_order.append(module_path)
-                module_items[module_path].append(item)
+        # group the items by their module in a single pass
+        module_items = _group_items_by_module(items)
+        # create the sort key once so that it is shared by every module
+        sort_key: Optional[Callable[["Item"], Any]] = None
+        if reorder_by == COST:
+            sort_key = self._get_total_duration_key()
+        elif reorder_by == NAME:
+            # the key for sorting by name is the nodeid of the test item
+            sort_key = attrgetter(NODEID)
         reordered_items = []
-        # if there are sorted modules, then add an extra newline
-        # to separate the diagnostic output from what appeared before
-        if module_order:
-            console.print()
+        diagnostic_lines = []
         # iterate over the modules and reorder the tests within each module
-        for module in module_order:
-            console.print(
-                f":flashlight: pytest-brightest: Reordering tests in module {module}"
+        for module in module_items:
+            diagnostic_lines.append(
+                f"{FLASHLIGHT_PREFIX} Reordering tests in module {module}"
             )
-            if reorder_by == COST:
-                module_items[module].sort(
-                    key=self.get_test_total_duration, reverse=not ascending
-                )
-            elif reorder_by == NAME:
-                # when sorting by name, the direction can be ascending or descending
-                # and the key for sorting is the nodeid of the test item
-                if ascending:
-                    module_items[module].sort(
-                        key=lambda item: getattr(item, NODEID, EMPTY_STRING),
-                        reverse=False,
-                    )
-                else:
-                    module_items[module].sort(
-                        key=lambda item: getattr(item, NODEID, EMPTY_STRING),
-                        reverse=True,
-                    )
+            if sort_key is not None:
+                module_items[module].sort(key=sort_key, reverse=not ascending)
             reordered_items.extend(module_items[module])
+        # display all of the diagnostic messages for the modules at once
+        _print_diagnostics(diagnostic_lines)
         # replace the original list of items with the reordered list
         items[:] = reordered_items
 
@@ -428,12 +424,11 @@ class ReordererOfTests:
     ) -> None:
         """Reorder tests across all modules by the specified technique."""
         if reorder_by == COST:
-            items.sort(key=self.get_test_total_duration, reverse=not ascending)
-        elif reorder_by == NAME:
             items.sort(
-                key=lambda item: getattr(item, NAME, EMPTY_STRING),
-                reverse=not ascending,
+                key=self._get_total_duration_key(), reverse=not ascending
             )
+        elif reorder_by == NAME:
+            items.sort(key=attrgetter(NAME), reverse=not ascending)
         elif reorder_by == FAILURE:
             passing_tests, failing_tests = self.classify_tests_by_outcome(
                 items
@@ -445,7 +440,8 @@ class ReordererOfTests:
 
     def has_test_data(self) -> bool:
         """Check if test performance data is available."""
-        return bool(self.test_data)
+        self._ensure_loaded()
+        return bool(self._total_durations)
 
 
 def create_reorderer(
@@ -464,17 +460,22 @@ def setup_json_report_plugin(config) -> bool:
     # that it produces is useful for certain reordering tasks like,
     # for instance, reordering tests by cumulative execution time
     try:
-        # determine whether or not the pytest-json-report plugin is available
-        # and display a suitable diagnostic message before running test suite
+        # determine whether or not the pytest-json-report plugin is available;
+        # if it is not, then there is nothing to configure and the function
+        # returns early without creating the cache directory; note that this
+        # is not a failure since techniques like reordering by name do not
+        # need the data in the JSON report and thus remain available
         plugin_manager = config.pluginmanager
-        if plugin_manager.has_plugin(PYTEST_JSON_REPORT_PLUGIN_NAME):
-            console.print(
-                f"{FLASHLIGHT_PREFIX} Detected the pytest-json-report plugin"
-            )
-        else:
+        if not plugin_manager.has_plugin(PYTEST_JSON_REPORT_PLUGIN_NAME):
             console.print(
                 f"{FLASHLIGHT_PREFIX} Did not detect pytest-json-report plugin"
             )
+            return True
+        # collect the diagnostic messages so that they are displayed with
+        # a single console call before running the test suite
+        diagnostic_lines = [
+            f"{FLASHLIGHT_PREFIX} Detected the pytest-json-report plugin"
+        ]
         # configure the directory where the pytest-json-report plugin will
         # store its JSON report file used by pytest-brightest for certain
         # tasks like test reordering according to cumulative execution time
@@ -488,25 +489,20 @@ def setup_json_report_plugin(config) -> bool:
             hasattr(config.option, JSON_REPORT_FILE)
             and config.option.json_report_file == REPORT_JSON
         ):
-            console.print(
+            diagnostic_lines.append(
                 f"{FLASHLIGHT_PREFIX} Not using the pytest-json-report in {config.option.json_report_file}"
             )
         # set the JSON report file location for pytest-json-report plugin
         # to be the default location that is used by the pytest-brightest plugin
         config.option.json_report_file = json_report_file
-        console.print(
+        diagnostic_lines.append(
             f"{FLASHLIGHT_PREFIX} Using the pytest-json-report with name {json_report_file}"
         )
+        _print_diagnostics(diagnostic_lines)
         return True
-    # was not able to import pytest_jsonreport's plugin which means that it cannot
-    # be extract to support certain types of prioritization enabled by pytest-brightest
-    except ImportError as e:
-        console.print(
-            f"{HIGH_BRIGHTNESS_PREFIX} pytest-brightest: pytest-json-report not available: {e}"
-        )
-        return False
-    # some other problem occurred and the pytest-brightest plugin cannot use
-    # the pytest-json-report plugin
+    # some problem occurred and the pytest-brightest plugin cannot use
+    # the pytest-json-report plugin; note that there is no import of the
+    # pytest-json-report plugin here and thus no ImportError to handle
     except Exception as e:
         console.print(
             f"{HIGH_BRIGHTNESS_PREFIX} pytest-brightest: pytest-json report not setup: {e}"
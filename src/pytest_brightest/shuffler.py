@@ -9,6 +9,32 @@ if TYPE_CHECKING:
     from _pytest.nodes import Item  # type: ignore
 
 
+def _get_file_path(item: "Item") -> str:
+    """Get the path to the file that contains a test item."""
+    # pytest items have an fspath attribute that contains the path to the file
+    # and we can also use the path attribute as a fallback; note that the
+    # fallback is only looked up when it is needed instead of every time
+    file_path = getattr(item, FSPATH, None)
+    if file_path is None:
+        file_path = getattr(item, PATH, UNKNOWN)
+    return str(file_path)
+
+
+def _group_items_by_file(items: List["Item"]) -> Dict[str, List["Item"]]:
+    """Group test items by their file path while preserving the file order."""
+    file_groups: Dict[str, List["Item"]] = {}
+    # iterate over each item and group it by its file path; since dictionaries
+    # preserve insertion order, the keys record the order of the files
+    for item in items:
+        file_path = _get_file_path(item)
+        file_group = file_groups.get(file_path)
+        if file_group is None:
+            file_group = file_groups[file_path] = []
+        # add the item to the list of items for the current file path
+        file_group.append(item)
+    return file_groups
+
+
 class ShufflerOfTests:
     """Handles test shuffling with configurable random seeding."""
 
@@ -53,34 +79,15 @@ class ShufflerOfTests:
         # it is not possible to shuffle an empty list of items
         if not items:
             return
-        # create a dictionary to group items by their file path
-        file_groups: Dict[str, List["Item"]] = {}
-        # create a list to maintain the order of the files
-        file_order = []
-        # iterate over each item and group it by its file path
-        for item in items:
-            # pytest items have an fspath attribute that contains the path to the file
-            # and we can also use the path attribute as a fallback
-            file_path = getattr(
-                item, FSPATH, str(getattr(item, PATH, UNKNOWN))
-            )
-            file_path_str = str(file_path)
-            # if the file path is not already in the file_groups dictionary,
-            # add it and also add it to the file_order list
-            if file_path_str not in file_groups:
-                file_groups[file_path_str] = []
-                file_order.append(file_path_str)
-            # add the item to the list of items for the current file path
-            file_groups[file_path_str].append(item)
-        # clear the original list of items so that it can be repopulated
+        # group the items by their file path in a single pass
+        file_groups = _group_items_by_file(items)
+        # clear the original list of items since the groups hold every item
         items.clear()
-        # iterate over the file_order list to preserve the original file order
-        for file_path in file_order:
-            # get the list of items for the current file path
-            file_items = file_groups[file_path]
+        # iterate over the file groups to preserve the original file order
+        for file_items in file_groups.values():
             # shuffle the list of items for the current file path in place
             self._random.shuffle(file_items)
-            # add the shuffled items to the original list of items
+            # add the shuffled items back to the original list of items
             items.extend(file_items)
 
     def shuffle_files_in_place(self, items: List["Item"]) -> None:
@@ -88,32 +95,17 @@ class ShufflerOfTests:
         # it is not possible to shuffle an empty list of items
         if not items:
             return
-        # create a dictionary to group items by their file path
-        file_groups: Dict[str, List["Item"]] = {}
-        # create a list to maintain the order of the files
-        file_order = []
-        # iterate over each item and group it by its file path
-        for item in items:
-            # pytest items have an fspath attribute that contains the path to the file
-            # and we can also use the path attribute as a fallback
-            file_path = getattr(
-                item, FSPATH, str(getattr(item, PATH, UNKNOWN))
-            )
-            file_path_str = str(file_path)
-            # if the file path is not already in the file_groups dictionary,
-            # add it and also add it to the file_order list
-            if file_path_str not in file_groups:
-                file_groups[file_path_str] = []
-                file_order.append(file_path_str)
-            # add the item to the list of items for the current file path
-            file_groups[file_path_str].append(item)
+        # group the items by their file path in a single pass and
+        # create a list of the files in their original order
+        file_groups = _group_items_by_file(items)
+        file_order = list(file_groups)
         # shuffle the order of the files in place
         self._random.shuffle(file_order)
-        # clear the original list of items so that it can be repopulated
+        # clear the original list of items since the groups hold every item
         items.clear()
         # iterate over the shuffled file_order list
         for file_path in file_order:
-            # add the items for the current file path to the original list
+            # add the items for the current file path back to the list
             items.extend(file_groups[file_path])
 
 
@@ -2,6 +2,11 @@
 
 # ruff: noqa: PLR2004
 
+import json
+from types import SimpleNamespace
+
+import pytest
+
 from pytest_brightest.plugin import (
     BrightestPlugin,
     _get_brightest_data,
@@ -12,76 +17,68 @@ from pytest_brightest.plugin import (
     pytest_runtest_logreport,
     pytest_sessionfinish,
 )
+from pytest_brightest.reorder import (
+    ReordererOfTests,
+    setup_json_report_plugin,
+)
 
 
-class TestBrightestPlugin:
-    """Test the BrightestPlugin class."""
+@pytest.fixture(autouse=True)
+def mock_console_print(mocker):
+    """Patch the console output of the plugin for every test in this module."""
+    return mocker.patch("pytest_brightest.plugin.console.print")
 
-    def test_configure_disabled(self, mock_config):
-        """Test that the plugin is disabled by default."""
-        plugin = BrightestPlugin()
-        config = mock_config()
-        plugin.configure(config)
-        assert not plugin.enabled
 
-    def test_configure_enabled(self, mock_config, mocker):
-        """Test that the plugin can be enabled."""
-        mocker.patch("pytest_brightest.plugin.console.print")
-        mocker.patch(
-            "pytest_brightest.plugin.setup_json_report_plugin",
-            return_value=True,
-        )
-        plugin = BrightestPlugin()
-        config = mock_config({"--brightest": True})
-        plugin.configure(config)
-        assert plugin.enabled
+class TestBrightestPlugin:
+    """Test the BrightestPlugin class."""
 
-    def test_configure_shuffle(self, mock_config, mocker):
-        """Test that the plugin can be configured to shuffle."""
-        mocker.patch("pytest_brightest.plugin.console.print")
-        mocker.patch(
+    @pytest.fixture(autouse=True)
+    def mock_setup_json_report_plugin(self, mocker):
+        """Patch the setup of the pytest-json-report plugin to succeed."""
+        return mocker.patch(
             "pytest_brightest.plugin.setup_json_report_plugin",
             return_value=True,
         )
-        plugin = BrightestPlugin()
-        config = mock_config(
-            {
-                "--brightest": True,
-                "--reorder-by-technique": "shuffle",
-                "--seed": 42,
-            }
-        )
-        plugin.configure(config)
-        assert plugin.shuffle_enabled
-        assert plugin.seed == 42
 
-    def test_configure_reorder(self, mock_config, mocker):
-        """Test that the plugin can be configured to reorder."""
-        mocker.patch("pytest_brightest.plugin.console.print")
-        mocker.patch(
-            "pytest_brightest.plugin.setup_json_report_plugin",
-            return_value=True,
-        )
+    @pytest.mark.parametrize(
+        ("options", "expected"),
+        [
+            ({}, {"enabled": False}),
+            ({"--brightest": True}, {"enabled": True}),
+            (
+                {
+                    "--brightest": True,
+                    "--reorder-by-technique": "shuffle",
+                    "--seed": 42,
+                },
+                {"enabled": True, "shuffle_enabled": True, "seed": 42},
+            ),
+            (
+                {
+                    "--brightest": True,
+                    "--reorder-by-technique": "cost",
+                    "--reorder-in-direction": "ascending",
+                },
+                {
+                    "enabled": True,
+                    "reorder_enabled": True,
+                    "reorder_by": "cost",
+                    "reorder": "ascending",
+                },
+            ),
+        ],
+        ids=["disabled", "enabled", "shuffle", "reorder"],
+    )
+    def test_configure(self, mock_config, options, expected):
+        """Test that configuring the plugin sets the expected state."""
         plugin = BrightestPlugin()
-        config = mock_config(
-            {
-                "--brightest": True,
-                "--reorder-by-technique": "cost",
-                "--reorder-in-direction": "ascending",
-            }
-        )
+        config = mock_config(options)
         plugin.configure(config)
-        assert plugin.reorder_enabled
-        assert plugin.reorder_by == "cost"
-        assert plugin.reorder == "ascending"
+        for attribute, value in expected.items():
+            assert getattr(plugin, attribute) == value
 
-    def test_shuffle_tests(self, mock_config, mock_test_item, mocker):
+    def test_shuffle_tests(self, mock_config, mock_test_item):
         """Test that the plugin can shuffle tests."""
-        mocker.patch("pytest_brightest.plugin.console.print")
-        mocker.patch(
-            "pytest_brightest.plugin.setup_json_report_plugin",
-            return_value=True,
-        )
         plugin = BrightestPlugin()
         config = mock_config(
             {
@@ -99,15 +96,8 @@ class TestBrightestPlugin:
         plugin.shuffle_tests(items)
         assert [item.name for item in items] == ["two", "one", "three"]
 
-    def test_reorder_tests(
-        self, tmp_path, mock_config, mock_test_item, mocker
-    ):
+    def test_reorder_tests(self, tmp_path, mock_config, mock_test_item):
         """Test that the plugin can reorder tests."""
-        mocker.patch("pytest_brightest.plugin.console.print")
-        mocker.patch(
-            "pytest_brightest.plugin.setup_json_report_plugin",
-            return_value=True,
-        )
         _ = tmp_path
         plugin = BrightestPlugin()
         config = mock_config(
@@ -123,17 +113,48 @@ class TestBrightestPlugin:
         # this test is not complete as it requires a json file
         assert [item.name for item in items] == ["slow", "fast"]
 
-    def test_configure_shuffle_with_direction_warning(
-        self, mock_config, mocker
+    def test_reorder_tests_by_name_without_json_report_plugin(
+        self,
+        mocker,
+        mock_config,
+        mock_console_print,
+        mock_setup_json_report_plugin,
+        mock_test_item,
     ):
-        """Test that a warning is issued when shuffling with a direction."""
-        mock_console_print = mocker.patch(
-            "pytest_brightest.plugin.console.print"
+        """Test that reordering by name works without pytest-json-report."""
+        mocker.patch("pytest_brightest.reorder.console.print")
+        mock_setup_json_report_plugin.side_effect = setup_json_report_plugin
+        plugin = BrightestPlugin()
+        config = mock_config(
+            {
+                "--brightest": True,
+                "--reorder-by-technique": "name",
+                "--reorder-by-focus": "modules-within-suite",
+                "--reorder-in-direction": "descending",
+            }
         )
-        mocker.patch(
-            "pytest_brightest.plugin.setup_json_report_plugin",
-            return_value=True,
+        config.pluginmanager = SimpleNamespace(has_plugin=lambda name: False)
+        plugin.configure(config)
+        items = [
+            mock_test_item("test_w.py::test_w"),
+            mock_test_item("test_x.py::test_x"),
+            mock_test_item("test_y.py::test_y"),
+        ]
+        plugin.reorder_tests(items)
+        assert [item.nodeid for item in items] == [
+            "test_y.py::test_y",
+            "test_x.py::test_x",
+            "test_w.py::test_w",
+        ]
+        assert not any(
+            "setup failed" in str(call)
+            for call in mock_console_print.mock_calls
         )
+
+    def test_configure_shuffle_with_direction_warning(
+        self, mock_config, mock_console_print
+    ):
+        """Test that a warning is issued when shuffling with a direction."""
         plugin = BrightestPlugin()
         config = mock_config(
             {
@@ -147,15 +168,11 @@ class TestBrightestPlugin:
             ":high_brightness: pytest-brightest: Warning: --reorder-in-direction is ignored when --reorder-by-technique is 'shuffle'"
         )
 
-    def test_configure_json_report_setup_fails(self, mock_config, mocker):
+    def test_configure_json_report_setup_fails(
+        self, mock_config, mock_console_print, mock_setup_json_report_plugin
+    ):
         """Test that a warning is issued when json report setup fails."""
-        mock_console_print = mocker.patch(
-            "pytest_brightest.plugin.console.print"
-        )
-        mocker.patch(
-            "pytest_brightest.plugin.setup_json_report_plugin",
-            return_value=False,
-        )
+        mock_setup_json_report_plugin.return_value = False
         plugin = BrightestPlugin()
         config = mock_config({"--brightest": True})
         plugin.configure(config)
@@ -186,6 +203,15 @@ def test_brightestplugin_store_session_items(mock_test_item):
 class TestHooks:
     """A container for all the tests of the hooks."""
 
+    @pytest.fixture
+    def mock_plugin(self, mocker):
+        """Patch the module-level plugin instance with an enabled stand-in."""
+        mock_plugin = mocker.patch(
+            "pytest_brightest.plugin._plugin", spec=True
+        )
+        mock_plugin.enabled = True
+        return mock_plugin
+
     def test_pytest_addoption(self, mocker):
         """Test that the command line options are added."""
         parser = mocker.MagicMock()
@@ -201,166 +227,94 @@ class TestHooks:
         pytest_configure(config)
         _plugin.configure.assert_called_once_with(config)  # type: ignore
 
-    def test_pytest_collection_modifyitems_first_strategy(
-        self, mocker, mock_config, mock_test_item
-    ):
-        """Test that pytest_collection_modifyitems modifies the items."""
-        # mock the _plugin instance and its methods
-        mock_plugin = mocker.patch(
-            "pytest_brightest.plugin._plugin", autospec=True
-        )
-        mock_plugin.enabled = True
-        mock_plugin.reorder_enabled = True
-        mock_plugin.shuffle_enabled = False
-        mock_plugin.technique = None
-        config = mock_config()
-        items = [mock_test_item("one"), mock_test_item("two")]
-        pytest_collection_modifyitems(config, items)
-        mock_plugin.reorder_tests.assert_called_once_with(items)
-
-    def test_pytest_collection_modifyitems_second_strategy(
-        self, mocker, mock_config, mock_test_item
-    ):
-        """Test that pytest_collection_modifyitems modifies the items."""
-        # mock the _plugin instance and its methods
-        mock_plugin = mocker.patch(
-            "pytest_brightest.plugin._plugin", autospec=True
-        )
-        mock_plugin.enabled = True
-        mock_plugin.reorder_enabled = False
-        mock_plugin.shuffle_enabled = True
-        mock_plugin.technique = None
-        config = mock_config()
-        items = [mock_test_item("one"), mock_test_item("two")]
-        pytest_collection_modifyitems(config, items)
-        mock_plugin.shuffle_tests.assert_called_once_with(items)
-
-    def test_pytest_collection_modifyitems_default_to_reorder(
-        self, mocker, mock_config, mock_test_item
-    ):
-        """Test that pytest_collection_modifyitems modifies the items."""
-        # mock the _plugin instance and its methods
-        mock_plugin = mocker.patch(
-            "pytest_brightest.plugin._plugin", autospec=True
-        )
-        mock_plugin.enabled = True
-        mock_plugin.reorder_enabled = True
-        mock_plugin.shuffle_enabled = True
-        mock_plugin.technique = None
-        config = mock_config()
-        items = [mock_test_item("one"), mock_test_item("two")]
-        pytest_collection_modifyitems(config, items)
-        mock_plugin.reorder_tests.assert_called_once_with(items)
-
-    def test_pytest_collection_modifyitems_reorder_and_shuffle_prefers_reorder(
-        self, mocker, mock_config, mock_test_item
+    @pytest.mark.parametrize(
+        ("enabled_techniques", "called"),
+        [
+            ((True, False), "reorder_tests"),
+            ((False, True), "shuffle_tests"),
+            ((True, True), "reorder_tests"),
+        ],
+        ids=["reorder", "shuffle", "reorder-and-shuffle-prefers-reorder"],
+    )
+    def test_pytest_collection_modifyitems(
+        self,
+        mock_plugin,
+        mock_config,
+        mock_test_item,
+        enabled_techniques,
+        called,
     ):
-        """Test that reordering is preferred when reordering and shuffling are enabled."""
-        # mock the _plugin instance and its methods
-        mock_plugin = mocker.patch(
-            "pytest_brightest.plugin._plugin", autospec=True
+        """Test that pytest_collection_modifyitems reorders or shuffles the items."""
+        mock_plugin.reorder_enabled, mock_plugin.shuffle_enabled = (
+            enabled_techniques
         )
-        mock_plugin.enabled = True
-        mock_plugin.reorder_enabled = True
-        mock_plugin.shuffle_enabled = True
         mock_plugin.technique = None
         config = mock_config()
         items = [mock_test_item("one"), mock_test_item("two")]
         pytest_collection_modifyitems(config, items)
-        mock_plugin.reorder_tests.assert_called_once_with(items)
-        mock_plugin.shuffle_tests.assert_not_called()
-
-    def test_pytest_runtest_logreport(self, mocker):
+        mock_plugin.store_session_items.assert_called_once_with(items)
+        # exactly one of the two techniques is applied to the items
+        for method in ("reorder_tests", "shuffle_tests"):
+            if method == called:
+                getattr(mock_plugin, method).assert_called_once_with(items)
+            else:
+                getattr(mock_plugin, method).assert_not_called()
+
+    def test_pytest_runtest_logreport(self, mock_plugin):
         """Test that pytest_runtest_logreport records failures."""
-        mock_plugin = mocker.patch(
-            "pytest_brightest.plugin._plugin", autospec=True
-        )
-        mock_plugin.enabled = True
         mock_plugin.technique = "failure"
-        report = mocker.MagicMock()
-        report.failed = True
-        report.when = "call"
-        report.nodeid = "test_node"
+        report = SimpleNamespace(failed=True, when="call", nodeid="test_node")
         pytest_runtest_logreport(report)
         mock_plugin.record_test_failure.assert_called_once_with("test_node")
 
-    def test_pytest_sessionfinish_no_json_file(self, mocker, mock_config):
+    def test_pytest_sessionfinish_no_json_file(
+        self, mock_plugin, mock_console_print, tmp_path
+    ):
         """Test that pytest_sessionfinish handles no JSON file."""
-        _ = mock_config
-        mock_plugin = mocker.patch(
-            "pytest_brightest.plugin._plugin", autospec=True
-        )
-        mock_plugin.enabled = True
         mock_plugin.technique = None
-        mock_plugin.brightest_json_file = "non_existent.json"
-        mocker.patch("pathlib.Path.exists", return_value=False)
-        mock_console_print = mocker.patch(
-            "pytest_brightest.plugin.console.print"
-        )
-        pytest_sessionfinish(mocker.MagicMock(), 0)
+        mock_plugin.brightest_json_file = str(tmp_path / "non_existent.json")
+        pytest_sessionfinish(SimpleNamespace(items=[]), 0)
         assert mock_console_print.call_count == 3
         mock_console_print.assert_any_call(
             ":high_brightness: pytest-brightest: There is no JSON file created by pytest-json-report"
         )
+        assert not (tmp_path / "non_existent.json").exists()
 
-    def test_pytest_sessionfinish_with_json_file(self, mocker, mock_config):
+    def test_pytest_sessionfinish_with_json_file(
+        self, mock_plugin, mock_console_print, tmp_path
+    ):
         """Test that pytest_sessionfinish processes JSON file."""
-        _ = mock_config
-        mock_plugin = mocker.patch(
-            "pytest_brightest.plugin._plugin", autospec=True
-        )
-        mock_plugin.enabled = True
-        mock_plugin.brightest_json_file = "existent.json"
+        json_path = tmp_path / "report.json"
+        json_path.write_text(json.dumps({"tests": []}))
+        mock_plugin.brightest_json_file = str(json_path)
         mock_plugin.technique = "cost"
         mock_plugin.focus = "tests-across-modules"
         mock_plugin.direction = "ascending"
         mock_plugin.seed = 123
-        mock_path_exists = mocker.patch(
-            "pathlib.Path.exists", return_value=True
-        )
-        mock_json_load = mocker.patch("json.load", return_value={"tests": []})
-        mock_json_dump = mocker.patch("json.dump")
-        mock_console_print = mocker.patch(
-            "pytest_brightest.plugin.console.print"
-        )
-
-        mock_file_handle = mocker.MagicMock()
-        mocker.patch("pathlib.Path.open", return_value=mock_file_handle)
-        mocker.patch(
-            "pathlib.Path.stat", return_value=mocker.MagicMock(st_size=100)
-        )
-        # mock _plugin.reorderer directly
-        mock_plugin.reorderer = mocker.MagicMock()
-        mock_plugin.reorderer.get_test_total_duration.return_value = (
-            0.5  # example return value
-        )
-
-        mock_session = mocker.MagicMock()
-        mock_session.items = []
+        mock_plugin.reorderer = ReordererOfTests(str(json_path))
+        mock_session = SimpleNamespace(items=[])
         pytest_sessionfinish(mock_session, 0)
-        mock_path_exists.assert_called_once_with()
-        mock_json_load.assert_called_once_with(
-            mock_file_handle.__enter__.return_value
-        )
-        mock_json_dump.assert_called_once()
+        data = json.loads(json_path.read_text())
+        assert data["tests"] == []
+        assert data["brightest"]["test_costs"] == {}
+        assert data["brightest"]["technique"] == "cost"
+        assert data["brightest"]["seed"] == 123
         assert mock_console_print.call_count == 3
         mock_console_print.assert_any_call(
-            f":flashlight: pytest-brightest: pytest-json-report detected at {mock_plugin.brightest_json_file}"
+            f":flashlight: pytest-brightest: pytest-json-report detected at {json_path}"
         )
 
     def test_pytest_sessionfinish_failure_module_counts(
-        self, mocker, mock_config, tmp_path, mock_test_item
+        self, mocker, mock_plugin, tmp_path, mock_test_item
     ):
         """Test that pytest_sessionfinish saves module failure counts for failure reordering."""
-        _ = mock_config
-        mock_plugin = mocker.patch(
-            "pytest_brightest.plugin._plugin", autospec=True
-        )
-        mock_plugin.enabled = True
-        mock_plugin.brightest_json_file = str(tmp_path / "report.json")
+        json_path = tmp_path / "report.json"
+        json_path.write_text(json.dumps({"tests": []}))
+        mock_plugin.brightest_json_file = str(json_path)
         mock_plugin.technique = "failure"
         mock_plugin.focus = "modules-within-suite"
         mock_plugin.direction = "descending"
+        mock_plugin.seed = None
         mock_plugin.current_session_failures = {
             "module_a.py": 1,
             "module_b.py": 2,
@@ -381,30 +335,18 @@ class TestHooks:
             "module_b.py::test_b3": "failed",
             "module_c.py::test_c1": "passed",
         }.get(item.nodeid, "passed")
-        mocker.patch("pathlib.Path.exists", return_value=True)
-        mocker.patch("json.load", return_value={"tests": []})
-        mock_json_dump = mocker.patch("json.dump")
-        mocker.patch("pytest_brightest.plugin.console.print")
-
-        mock_file_handle = mocker.MagicMock()
-        mocker.patch("pathlib.Path.open", return_value=mock_file_handle)
-        mocker.patch(
-            "pathlib.Path.stat", return_value=mocker.MagicMock(st_size=100)
+        mock_session = SimpleNamespace(
+            items=[
+                mock_test_item("module_a.py::test_a1", outcome="passed"),
+                mock_test_item("module_a.py::test_a2", outcome="failed"),
+                mock_test_item("module_b.py::test_b1", outcome="passed"),
+                mock_test_item("module_b.py::test_b2", outcome="failed"),
+                mock_test_item("module_b.py::test_b3", outcome="failed"),
+                mock_test_item("module_c.py::test_c1", outcome="passed"),
+            ]
         )
-        mock_session = mocker.MagicMock()
-        mock_session.items = [
-            mock_test_item("module_a.py::test_a1", outcome="passed"),
-            mock_test_item("module_a.py::test_a2", outcome="failed"),
-            mock_test_item("module_b.py::test_b1", outcome="passed"),
-            mock_test_item("module_b.py::test_b2", outcome="failed"),
-            mock_test_item("module_b.py::test_b3", outcome="failed"),
-            mock_test_item("module_c.py::test_c1", outcome="passed"),
-        ]
         pytest_sessionfinish(mock_session, 0)
-        mock_json_dump.assert_called_once()
-        args, kwargs = mock_json_dump.call_args
-        _ = kwargs
-        dumped_data = args[0]
+        dumped_data = json.loads(json_path.read_text())
         assert dumped_data["brightest"]["module_failure_counts"] == {
             "module_a.py": 1,
             "module_b.py": 2,
@@ -414,10 +356,8 @@ class TestHooks:
 
 def test_get_brightest_data_all_branches(mocker, mock_test_item):
     """Test _get_brightest_data for all branches."""
-    mock_plugin = mocker.patch(
-        "pytest_brightest.plugin._plugin", autospec=True
-    )
-    mock_session = mocker.MagicMock()
+    mock_plugin = mocker.patch("pytest_brightest.plugin._plugin", spec=True)
+    mock_session = SimpleNamespace(items=[])
     # technique: cost, Focus: modules-within-suite
     mock_plugin.technique = "cost"
     mock_plugin.focus = "modules-within-suite"
@@ -444,3 +384,49 @@ def test_get_brightest_data_all_branches(mocker, mock_test_item):
     mock_plugin.focus = "tests-within-module"
     data = _get_brightest_data(mock_session)
     assert "current_module_tests" in data
+
+
+def test_get_brightest_data_current_session_modules(
+    mocker, tmp_path, mock_test_item
+):
+    """Test _get_brightest_data aggregates the current session by module."""
+    json_path = tmp_path / "report.json"
+    json_path.write_text(
+        json.dumps(
+            {
+                "tests": [
+                    {"nodeid": "mod1::t1", "call": {"duration": 1.0}},
+                    {"nodeid": "mod1::t2", "call": {"duration": 2.0}},
+                    {"nodeid": "mod2::t1", "call": {"duration": 4.0}},
+                ]
+            }
+        )
+    )
+    mock_plugin = mocker.patch("pytest_brightest.plugin._plugin", spec=True)
+    mock_plugin.reorderer = ReordererOfTests(str(json_path))
+    mock_plugin.session_items = None
+    mock_session = SimpleNamespace(
+        items=[
+            mock_test_item("mod1::t1"),
+            mock_test_item("mod2::t1"),
+            mock_test_item("mod1::t2"),
+        ]
+    )
+    mock_plugin.technique = "cost"
+    mock_plugin.focus = "tests-within-module"
+    data = _get_brightest_data(mock_session)
+    assert data["current_module_costs"] == {"mod1": 3.0, "mod2": 4.0}
+    assert data["current_test_costs"] == {
+        "mod1::t1": 1.0,
+        "mod2::t1": 4.0,
+        "mod1::t2": 2.0,
+    }
+    mock_plugin.technique = "name"
+    data = _get_brightest_data(mock_session)
+    assert data["current_module_tests"] == {
+        "mod1": ["mod1::t1", "mod1::t2"],
+        "mod2": ["mod2::t1"],
+    }
+    mock_plugin.focus = "modules-within-suite"
+    data = _get_brightest_data(mock_session)
+    assert data["current_module_order"] == ["mod1", "mod2"]
@@ -6,11 +6,20 @@ import pytest
 
 from pytest_brightest.reorder import (
     ReordererOfTests,
+    _module_of,
     create_reorderer,
     setup_json_report_plugin,
 )
 
 
+def _seed_test_data(reorderer, test_data):
+    """Store the data about the test cases as if it was loaded from a report."""
+    for node_id, test_info in test_data.items():
+        reorderer._total_durations[node_id] = test_info["total_duration"]
+        reorderer._outcomes[node_id] = test_info["outcome"]
+    reorderer._loaded = True
+
+
 def test_create_reorderer():
     """Test the create_reorderer function."""
     reorderer = create_reorderer()
@@ -23,6 +32,16 @@ def test_create_reorderer():
     assert reorderer.json_report_path == "custom.json"
 
 
+def test__module_of():
+    """Test extracting the module path from a node ID."""
+    assert _module_of("tests/test_a.py::test_one") == "tests/test_a.py"
+    assert (
+        _module_of("tests/test_a.py::TestClass::test_one") == "tests/test_a.py"
+    )
+    assert _module_of("tests/test_a.py") == "tests/test_a.py"
+    assert _module_of("") == ""
+
+
 def test_load_test_data_json_decode_error(tmp_path):
     """Test loading test data with JSON decode error."""
     json_path = tmp_path / "bad.json"
@@ -65,6 +84,7 @@ def test_get_prior_data_for_reordering_all_branches(tmp_path, mock_test_item):
         items, "cost", "modules-within-suite"
     )
     assert "prior_module_costs" in d
+    assert d["prior_module_costs"] == {"mod1": 3.0, "mod2": 3.0}
     # COST, TESTS_WITHIN_MODULE
     d = reorderer.get_prior_data_for_reordering(
         items, "cost", "tests-within-module"
@@ -107,6 +127,28 @@ def test_reorder_tests_in_place_empty():
     assert items == []
 
 
+def test_reorder_tests_in_place_no_test_data(mock_test_item, mocker):
+    """Test that reordering without prior data keeps the order of the modules."""
+    reorderer = ReordererOfTests("non_existent.json")
+    reorderer.last_module_failure_counts = {"mod3": 1}
+    items = [mock_test_item("mod2::t1"), mock_test_item("mod1::t1")]
+    mock_console_print = mocker.patch("pytest_brightest.reorder.console.print")
+    for technique in ("cost", "failure"):
+        reorderer.reorder_tests_in_place(
+            items, technique, "descending", "modules-within-suite"
+        )
+    assert [item.name for item in items] == ["mod2::t1", "mod1::t1"]
+    assert reorderer.last_module_failure_counts == {"mod2": 0, "mod1": 0}
+    mock_console_print.assert_called_with(
+        "\n:flashlight: pytest-brightest: Module mod2 has 0 failing tests from previous run"
+        "\n:flashlight: pytest-brightest: Module mod1 has 0 failing tests from previous run"
+    )
+    reorderer.reorder_tests_in_place(
+        items, "name", "ascending", "modules-within-suite"
+    )
+    assert [item.name for item in items] == ["mod1::t1", "mod2::t1"]
+
+
 def test_reorder_tests_in_place_all_branches(tmp_path, mock_test_item, mocker):
     """Test reordering tests in place for all branches."""
     json_path = tmp_path / "report.json"
@@ -183,19 +225,28 @@ def test_setup_json_report_plugin_branches(mocker):
         pluginmanager = PluginManager()
 
     config = DummyConfig()
-    mocker.patch("pytest_brightest.reorder.console.print")
+    mock_console_print = mocker.patch("pytest_brightest.reorder.console.print")
     assert setup_json_report_plugin(config) is True
+    mock_console_print.assert_called_once_with(
+        "\n:flashlight: pytest-brightest: Detected the pytest-json-report plugin"
+        "\n:flashlight: pytest-brightest: Not using the pytest-json-report in .report.json"
+        "\n:flashlight: pytest-brightest: Using the pytest-json-report with name .pytest_cache/pytest-json-report.json"
+    )
+    assert (
+        config.option.json_report_file
+        == ".pytest_cache/pytest-json-report.json"
+    )
 
-    # test ImportError
-    def raise_import_error(*args, **kwargs):
-        _ = args
-        _ = kwargs
-        raise ImportError("fail")
-
-    mocker.patch.object(
-        config.pluginmanager, "has_plugin", side_effect=raise_import_error
+    # test that a missing pytest-json-report plugin is not configured
+    config.option.json_report_file = ".report.json"
+    mock_mkdir = mocker.patch("pathlib.Path.mkdir")
+    mocker.patch.object(config.pluginmanager, "has_plugin", return_value=False)
+    assert setup_json_report_plugin(config) is True
+    mock_console_print.assert_called_with(
+        ":flashlight: pytest-brightest: Did not detect pytest-json-report plugin"
     )
-    assert setup_json_report_plugin(config) is False
+    mock_mkdir.assert_not_called()
+    assert config.option.json_report_file == ".report.json"
 
     # test Exception
     def raise_exception(*args, **kwargs):
@@ -224,8 +275,44 @@ class TestReordererOfTests:
         """Test loading test data when the file does not exist."""
         reorderer = ReordererOfTests("non_existent.json")
         assert not reorderer.has_test_data()
+        assert reorderer.brightest_data == {}
+
+    def test_load_test_data_directory(self, tmp_path):
+        """Test loading test data when the path is a directory."""
+        reorderer = ReordererOfTests(str(tmp_path))
+        assert not reorderer.has_test_data()
+        assert reorderer.brightest_data == {}
+
+    def test_load_test_data_is_lazy(self, tmp_path, mocker):
+        """Test that the JSON report is only parsed when data is needed."""
+        json_path = tmp_path / "report.json"
+        json_path.write_text(
+            json.dumps(
+                {"tests": [{"nodeid": "test_one", "outcome": "passed"}]}
+            )
+        )
+        mock_json_loads = mocker.patch(
+            "pytest_brightest.reorder.json.loads", wraps=json.loads
+        )
+        reorderer = ReordererOfTests(str(json_path))
+        mock_json_loads.assert_not_called()
+        assert reorderer.has_test_data()
+        assert reorderer.has_test_data()
+        mock_json_loads.assert_called_once()
+
+    def test_load_test_data_brightest_data(self, tmp_path):
+        """Test loading the brightest data from a JSON file."""
+        json_path = tmp_path / "report.json"
+        json_path.write_text(json.dumps({"tests": [], "brightest": None}))
+        reorderer = ReordererOfTests(str(json_path))
+        assert reorderer.brightest_data == {}
+        json_path.write_text(
+            json.dumps({"tests": [], "brightest": {"technique": "cost"}})
+        )
+        reorderer.load_test_data()
+        assert reorderer.brightest_data == {"technique": "cost"}
 
-    def test_load_test_data_with_file(self, tmp_path):
+    def test_load_test_data_with_file(self, tmp_path, mock_test_item):
         """Test loading test data from a valid JSON file."""
         json_path = tmp_path / "report.json"
         data = {
@@ -242,18 +329,93 @@ class TestReordererOfTests:
         json_path.write_text(json.dumps(data))
         reorderer = ReordererOfTests(str(json_path))
         assert reorderer.has_test_data()
-        assert "test_one" in reorderer.test_data
-        assert reorderer.test_data["test_one"][
-            "total_duration"
-        ] == pytest.approx(0.6)
-        assert reorderer.test_data["test_one"]["outcome"] == "passed"
+        item = mock_test_item("test_one")
+        assert reorderer.get_test_total_duration(item) == pytest.approx(0.6)
+        assert reorderer.get_test_outcome(item) == "passed"
+
+    def test_load_test_data_missing_stages(self, tmp_path, mock_test_item):
+        """Test loading test data when some test stages are missing."""
+        json_path = tmp_path / "report.json"
+        data = {
+            "tests": [
+                {
+                    "nodeid": "test_one",
+                    "setup": {"duration": 0.5},
+                    "teardown": {},
+                    "outcome": "failed",
+                }
+            ]
+        }
+        json_path.write_text(json.dumps(data))
+        reorderer = ReordererOfTests(str(json_path))
+        item = mock_test_item("test_one")
+        assert reorderer.get_test_total_duration(item) == 0.5  # noqa: PLR2004
+        assert reorderer.get_test_outcome(item) == "failed"
+
+    def test_load_test_data_interns_outcomes(self, tmp_path, mock_test_item):
+        """Test that loaded outcomes share interned string objects."""
+        json_path = tmp_path / "report.json"
+        json_path.write_text(
+            '{"tests": [{"nodeid": "test_one", "outcome": "failed"},'
+            ' {"nodeid": "test_two", "outcome": "failed"}]}'
+        )
+        reorderer = ReordererOfTests(str(json_path))
+        outcome_one = reorderer.get_test_outcome(mock_test_item("test_one"))
+        outcome_two = reorderer.get_test_outcome(mock_test_item("test_two"))
+        assert outcome_one is outcome_two
+
+    def test_load_test_data_invalid_outcome(self, tmp_path, mock_test_item):
+        """Test loading test data with an outcome that is not a string."""
+        json_path = tmp_path / "report.json"
+        json_path.write_text(
+            json.dumps(
+                {
+                    "tests": [
+                        {"nodeid": "a.py::t1", "outcome": "failed"},
+                        {"nodeid": "a.py::t2", "outcome": None},
+                        {"nodeid": "b.py::t3", "outcome": "failed"},
+                    ]
+                }
+            )
+        )
+        reorderer = ReordererOfTests(str(json_path))
+        assert reorderer.has_test_data()
+        assert (
+            reorderer.get_test_outcome(mock_test_item("a.py::t1")) == "failed"
+        )
+        assert (
+            reorderer.get_test_outcome(mock_test_item("a.py::t2")) == "unknown"
+        )
+        assert (
+            reorderer.get_test_outcome(mock_test_item("b.py::t3")) == "failed"
+        )
+
+    def test_load_test_data_invalid_duration(self, tmp_path, mock_test_item):
+        """Test that a report with a duration that is not a number is not loaded."""
+        json_path = tmp_path / "report.json"
+        json_path.write_text(
+            json.dumps(
+                {
+                    "tests": [
+                        {"nodeid": "a.py::t1", "call": {"duration": 1.0}},
+                        {"nodeid": "a.py::t2", "call": {"duration": "slow"}},
+                        {"nodeid": "b.py::t3", "call": {"duration": 2.0}},
+                    ]
+                }
+            )
+        )
+        reorderer = ReordererOfTests(str(json_path))
+        assert not reorderer.has_test_data()
+        item = mock_test_item("a.py::t1")
+        assert reorderer.get_test_total_duration(item) == 0.0
 
     def test_get_test_total_duration(self, mock_test_item):
         """Test getting the total duration of a test."""
         reorderer = ReordererOfTests()
-        reorderer.test_data = {
-            "test_one": {"total_duration": 1.23, "outcome": "passed"}
-        }
+        _seed_test_data(
+            reorderer,
+            {"test_one": {"total_duration": 1.23, "outcome": "passed"}},
+        )
         item = mock_test_item("test_one")
         assert reorderer.get_test_total_duration(item) == 1.23  # noqa: PLR2004
         item = mock_test_item("test_two")
@@ -262,9 +424,10 @@ class TestReordererOfTests:
     def test_get_test_outcome(self, mock_test_item):
         """Test getting the outcome of a test."""
         reorderer = ReordererOfTests()
-        reorderer.test_data = {
-            "test_one": {"total_duration": 1.23, "outcome": "failed"}
-        }
+        _seed_test_data(
+            reorderer,
+            {"test_one": {"total_duration": 1.23, "outcome": "failed"}},
+        )
         item = mock_test_item("test_one")
         assert reorderer.get_test_outcome(item) == "failed"
         item = mock_test_item("test_two")
@@ -273,11 +436,14 @@ class TestReordererOfTests:
     def test_classify_tests_by_outcome(self, mock_test_item):
         """Test classifying tests by their outcome."""
         reorderer = ReordererOfTests()
-        reorderer.test_data = {
-            "test_pass": {"total_duration": 1, "outcome": "passed"},
-            "test_fail": {"total_duration": 1, "outcome": "failed"},
-            "test_error": {"total_duration": 1, "outcome": "error"},
-        }
+        _seed_test_data(
+            reorderer,
+            {
+                "test_pass": {"total_duration": 1, "outcome": "passed"},
+                "test_fail": {"total_duration": 1, "outcome": "failed"},
+                "test_error": {"total_duration": 1, "outcome": "error"},
+            },
+        )
         items = [
             mock_test_item("test_pass"),
             mock_test_item("test_fail"),
@@ -291,10 +457,13 @@ class TestReordererOfTests:
     def test_sort_tests_by_total_duration(self, mock_test_item):
         """Test sorting tests by their total duration."""
         reorderer = ReordererOfTests()
-        reorderer.test_data = {
-            "test_slow": {"total_duration": 2.0, "outcome": "passed"},
-            "test_fast": {"total_duration": 1.0, "outcome": "passed"},
-        }
+        _seed_test_data(
+            reorderer,
+            {
+                "test_slow": {"total_duration": 2.0, "outcome": "passed"},
+                "test_fast": {"total_duration": 1.0, "outcome": "passed"},
+            },
+        )
         items = [mock_test_item("test_slow"), mock_test_item("test_fast")]
         sorted_items = reorderer.sort_tests_by_total_duration(items)
         assert [item.name for item in sorted_items] == [
@@ -312,11 +481,14 @@ class TestReordererOfTests:
     def test_reorder_modules_by_cost(self, mock_test_item, mocker):
         """Test reordering modules by their cumulative cost."""
         reorderer = ReordererOfTests()
-        reorderer.test_data = {
-            "mod1::test1": {"total_duration": 1.0, "outcome": "passed"},
-            "mod1::test2": {"total_duration": 2.0, "outcome": "passed"},
-            "mod2::test1": {"total_duration": 4.0, "outcome": "passed"},
-        }
+        _seed_test_data(
+            reorderer,
+            {
+                "mod1::test1": {"total_duration": 1.0, "outcome": "passed"},
+                "mod1::test2": {"total_duration": 2.0, "outcome": "passed"},
+                "mod2::test1": {"total_duration": 4.0, "outcome": "passed"},
+            },
+        )
         items = [
             mock_test_item("mod1::test1"),
             mock_test_item("mod1::test2"),
@@ -336,6 +508,33 @@ class TestReordererOfTests:
             "mod1::test2",
         ]
 
+    def test_get_module_costs_and_failure_counts(self, mock_test_item):
+        """Test calculating the cost and failure count of each module."""
+        reorderer = ReordererOfTests()
+        _seed_test_data(
+            reorderer,
+            {
+                "mod1::test1": {"total_duration": 1.0, "outcome": "failed"},
+                "mod1::test2": {"total_duration": 2.0, "outcome": "error"},
+                "mod2::test1": {"total_duration": 4.0, "outcome": "passed"},
+            },
+        )
+        module_items = {
+            "mod1": [
+                mock_test_item("mod1::test1"),
+                mock_test_item("mod1::test2"),
+            ],
+            "mod2": [mock_test_item("mod2::test1")],
+        }
+        assert reorderer.get_module_costs(module_items) == {
+            "mod1": 3.0,
+            "mod2": 4.0,
+        }
+        assert reorderer.get_module_failure_counts(module_items) == {
+            "mod1": 2,
+            "mod2": 0,
+        }
+
     def test_reorder_modules_by_name(self, mock_test_item, mocker):
         """Test reordering modules by their name."""
         reorderer = ReordererOfTests()
@@ -358,12 +557,15 @@ class TestReordererOfTests:
     def test_reorder_modules_by_failure(self, mock_test_item, mocker):
         """Test reordering modules by their failure count."""
         reorderer = ReordererOfTests()
-        reorderer.test_data = {
-            "mod_a::test1": {"total_duration": 1, "outcome": "failed"},
-            "mod_b::test1": {"total_duration": 1, "outcome": "passed"},
-            "mod_b::test2": {"total_duration": 1, "outcome": "failed"},
-            "mod_b::test3": {"total_duration": 1, "outcome": "failed"},
-        }
+        _seed_test_data(
+            reorderer,
+            {
+                "mod_a::test1": {"total_duration": 1, "outcome": "failed"},
+                "mod_b::test1": {"total_duration": 1, "outcome": "passed"},
+                "mod_b::test2": {"total_duration": 1, "outcome": "failed"},
+                "mod_b::test3": {"total_duration": 1, "outcome": "failed"},
+            },
+        )
         items = [
             mock_test_item("mod_a::test1"),
             mock_test_item("mod_b::test1"),
@@ -389,10 +591,19 @@ class TestReordererOfTests:
     def test_reorder_tests_within_module(self, mock_test_item, mocker):
         """Test reordering tests within each module."""
         reorderer = ReordererOfTests()
-        reorderer.test_data = {
-            "mod1::test_slow": {"total_duration": 2.0, "outcome": "passed"},
-            "mod1::test_fast": {"total_duration": 1.0, "outcome": "passed"},
-        }
+        _seed_test_data(
+            reorderer,
+            {
+                "mod1::test_slow": {
+                    "total_duration": 2.0,
+                    "outcome": "passed",
+                },
+                "mod1::test_fast": {
+                    "total_duration": 1.0,
+                    "outcome": "passed",
+                },
+            },
+        )
         items = [
             mock_test_item("mod1::test_slow"),
             mock_test_item("mod1::test_fast"),
@@ -417,11 +628,23 @@ class TestReordererOfTests:
     def test_reorder_tests_across_modules(self, mock_test_item):
         """Test reordering tests across all modules."""
         reorderer = ReordererOfTests()
-        reorderer.test_data = {
-            "mod2::test_slow": {"total_duration": 2.0, "outcome": "passed"},
-            "mod1::test_fast": {"total_duration": 1.0, "outcome": "passed"},
-            "mod1::test_fail": {"total_duration": 1.0, "outcome": "failed"},
-        }
+        _seed_test_data(
+            reorderer,
+            {
+                "mod2::test_slow": {
+                    "total_duration": 2.0,
+                    "outcome": "passed",
+                },
+                "mod1::test_fast": {
+                    "total_duration": 1.0,
+                    "outcome": "passed",
+                },
+                "mod1::test_fail": {
+                    "total_duration": 1.0,
+                    "outcome": "failed",
+                },
+            },
+        )
         items = [
             mock_test_item("mod2::test_slow"),
             mock_test_item("mod1::test_fast"),
@@ -459,3 +682,23 @@ class TestReordererOfTests:
             "mod2::test_slow",
             "mod1::test_fast",
         ]
+
+    def test_reorder_modules_prints_diagnostics_once(
+        self, mock_test_item, mocker
+    ):
+        """Test that module diagnostics are displayed with one console call."""
+        reorderer = ReordererOfTests()
+        items = [
+            mock_test_item("mod_b::test1"),
+            mock_test_item("mod_a::test1"),
+            mock_test_item("mod_c::test1"),
+        ]
+        mock_console_print = mocker.patch(
+            "pytest_brightest.reorder.console.print"
+        )
+        reorderer.reorder_modules_by_name(items)
+        mock_console_print.assert_called_once()
+        output = mock_console_print.call_args[0][0]
+        assert output.count("is in the reordered suite") == 3  # noqa: PLR2004
+        reorderer.reorder_modules_by_name([])
+        mock_console_print.assert_called_once()